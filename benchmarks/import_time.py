@@ -0,0 +1,53 @@
+"""Measures cold import time of loapy entry points.
+
+Run with `python benchmarks/import_time.py [--runs N]` from the repository root.
+"""
+
+import subprocess
+import sys
+from argparse import ArgumentParser
+from statistics import median
+from typing import List
+
+STATEMENTS = [
+    "import loapy",
+    "from loapy import LostArkError",
+    "from loapy import LostArkRest",
+]
+
+
+def measure(statement: str, runs: int) -> List[float]:
+    samples = []
+
+    for _ in range(runs):
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                f"from time import perf_counter; s = perf_counter(); {statement}; "
+                "print(perf_counter() - s)",
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        samples.append(float(output) * 1000)
+
+    return samples
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    for statement in STATEMENTS:
+        samples = measure(statement, args.runs)
+        print(
+            f"{statement:<35} median {median(samples):8.2f} ms"
+            f"  min {min(samples):8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,41 @@
 __version__ = "3.0.0.0"
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
 from .errors import BadGateway as BadGateway
+from .errors import CircuitOpen as CircuitOpen
 from .errors import Forbidden as Forbidden
 from .errors import GatewayTimeout as GatewayTimeout
 from .errors import InternalServerError as InternalServerError
 from .errors import LostArkError as LostArkError
 from .errors import NotFound as NotFound
+from .errors import QuotaExceeded as QuotaExceeded
 from .errors import ServiceUnavailable as ServiceUnavailable
 from .errors import Unauthorized as Unauthorized
-from .http import LostArkRest as LostArkRest
+
+if TYPE_CHECKING:
+    from . import types as types
+    from .http import LostArkRest as LostArkRest
+
+# Attributes imported on first access, so `import loapy` stays cheap
+_LAZY = {
+    "LostArkRest": ".http",
+    "types": ".types",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = import_module(_LAZY[name], __name__)
+    value = module if module.__name__ == f"{__name__}.{name}" else getattr(module, name)
+
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *_LAZY])
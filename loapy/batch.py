@@ -0,0 +1,193 @@
+from __future__ import annotations  # for postponed evaluation of annotations
+
+from asyncio import Future, Task, create_task, gather, sleep
+from logging import getLogger
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, cast
+
+from .errors import NotFound
+
+if TYPE_CHECKING:
+    from .http import LostArkRest
+    from .types.markets import MarketItem, MarketList, RequestMarketItems
+
+logger = getLogger("loapy.batch")
+
+# Requests needed to find the listing of a single item without its page
+SINGLE_COST = 2
+
+
+class MarketItemBatcher:
+    """Merges individual market item lookups into category-level searches.
+
+    Lookups requested within ``window`` seconds are collected and resolved
+    together from the pages of ``fetch_market_items`` in their category, so
+    the saving depends on ``category_code``. It is required unless the item
+    was seen in an earlier search. Pages are only read while they cost less
+    than looking the remaining items up one by one, which takes two requests
+    each: ``fetch_market_item`` for the item name, then a search by that name.
+    """
+
+    __slots__ = (
+        "rest",
+        "window",
+        "max_pages",
+        "__pending",
+        "__categories",
+        "__pages",
+        "__task",
+    )
+
+    def __init__(
+        self, rest: LostArkRest, *, window: float = 0.05, max_pages: int = 10
+    ) -> None:
+        self.rest = rest
+        self.window = window
+        self.max_pages = max_pages
+
+        self.__pending: Dict[int, Tuple[int, List[Future]]] = {}
+        self.__categories: Dict[int, int] = {}
+        self.__pages: Dict[int, int] = {}
+        self.__task: Optional[Task] = None
+
+    async def fetch(
+        self, item_id: int, category_code: Optional[int] = None
+    ) -> MarketItem:
+        """Returns the market listing of an item by ID.
+
+        The listing is the same MarketItem row ``fetch_market_items`` returns,
+        whichever way it is resolved. Raises NotFound if it is not listed.
+        """
+
+        if category_code is None:
+            category_code = self.__categories.get(item_id)
+
+        if category_code is None:
+            raise ValueError(f"Category of market item {item_id} is not known")
+
+        future: Future = Future()
+
+        if item_id in self.__pending:
+            self.__pending[item_id][1].append(future)
+        else:
+            self.__pending[item_id] = (category_code, [future])
+
+        if self.__task is None or self.__task.done():
+            self.__task = create_task(self.__flush())
+
+        return await future
+
+    async def __flush(self) -> None:
+        # Lookups made while a batch is being resolved are taken by the next round
+        while self.__pending:
+            await sleep(self.window)
+
+            pending, self.__pending = self.__pending, {}
+
+            groups: Dict[int, Set[int]] = {}
+
+            for item_id, (code, _) in pending.items():
+                groups.setdefault(code, set()).add(item_id)
+
+            logger.debug(
+                f"Resolving {len(pending)} market items with {len(groups)} categories"
+            )
+
+            await gather(
+                *(
+                    self.__resolve_category(code, ids, pending)
+                    for code, ids in groups.items()
+                )
+            )
+
+    async def __resolve_category(
+        self,
+        code: int,
+        item_ids: Set[int],
+        pending: Dict[int, Tuple[int, List[Future]]],
+    ) -> None:
+        remaining = set(item_ids)
+        page = 1
+
+        # Until the first page is read, the category is assumed to fit in one
+        pages = self.__pages.get(code, 1)
+
+        while remaining and page <= min(pages, self.max_pages):
+            if pages - page + 1 > len(remaining) * SINGLE_COST:
+                logger.debug(f"Category {code} has too many pages, falling back")
+                break
+
+            try:
+                market = await self.__search(code, None, page)
+            except Exception:
+                logger.debug(f"Failed to search category {code}, falling back")
+                break
+
+            for item in market["Items"]:
+                self.__categories[item["Id"]] = code
+
+                if item["Id"] in remaining:
+                    remaining.discard(item["Id"])
+                    self.__resolve(pending[item["Id"]][1], item)
+
+            pages = max(-(-market["TotalCount"] // market["PageSize"]), 1)
+            self.__pages[code] = pages
+
+            page += 1
+
+        await gather(
+            *(self.__resolve_single(item_id, code, pending) for item_id in remaining)
+        )
+
+    async def __search(
+        self, code: Optional[int], name: Optional[str], page: int = 1
+    ) -> MarketList:
+        return await self.rest.fetch_market_items(
+            cast(
+                "RequestMarketItems",
+                {
+                    "Sort": "GRADE",
+                    "CategoryCode": code,
+                    "ItemName": name,
+                    "PageNo": page,
+                    "SortCondition": "ASC",
+                },
+            )
+        )
+
+    async def __resolve_single(
+        self,
+        item_id: int,
+        code: int,
+        pending: Dict[int, Tuple[int, List[Future]]],
+    ) -> None:
+        futures = pending[item_id][1]
+
+        try:
+            # The item endpoint only returns price history, which has the name
+            # needed to find the market listing of the item
+            stats = await self.rest.fetch_market_item(item_id)
+
+            if not stats:
+                raise NotFound()
+
+            market = await self.__search(code, stats[0]["Name"])
+
+            for item in market["Items"]:
+                self.__categories[item["Id"]] = code
+
+                if item["Id"] == item_id:
+                    break
+            else:
+                raise NotFound()
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            self.__resolve(futures, item)
+
+    @staticmethod
+    def __resolve(futures: List[Future], result: MarketItem) -> None:
+        for future in futures:
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,72 @@
+from logging import getLogger
+from time import monotonic
+from typing import Literal, Optional
+
+logger = getLogger("loapy.circuit")
+
+CircuitState = Literal["closed", "open", "half-open"]
+
+
+class CircuitBreaker:
+    """Stops requests to an endpoint family that keeps failing with 5xx errors.
+
+    After ``threshold`` consecutive failures the circuit opens and requests
+    fail fast. Once ``cooldown`` seconds have passed a single probe request
+    is let through; its success closes the circuit and its failure opens it
+    again.
+    """
+
+    __slots__ = ("name", "threshold", "cooldown", "state", "failures", "__opened_at")
+
+    def __init__(
+        self, name: str, *, threshold: int = 5, cooldown: float = 30.0
+    ) -> None:
+        self.name = name
+        self.threshold = threshold
+        self.cooldown = cooldown
+
+        self.state: CircuitState = "closed"
+        self.failures: int = 0
+
+        self.__opened_at: Optional[float] = None
+
+    def allow(self) -> bool:
+        """Returns whether a request may be sent, claiming the probe if due."""
+
+        if self.state == "closed":
+            return True
+
+        if (
+            self.state == "open"
+            and self.__opened_at is not None
+            and monotonic() - self.__opened_at >= self.cooldown
+        ):
+            logger.info(f"Circuit of {self.name} is half-open, sending a probe")
+            self.state = "half-open"
+
+            return True
+
+        return False
+
+    def success(self) -> None:
+        if self.state != "closed":
+            logger.info(f"Circuit of {self.name} is closed")
+
+        self.state = "closed"
+        self.failures = 0
+
+    def failure(self) -> None:
+        self.failures += 1
+
+        if self.state == "half-open" or self.failures >= self.threshold:
+            if self.state != "open":
+                logger.warning(f"Circuit of {self.name} is open")
+
+            self.state = "open"
+            self.__opened_at = monotonic()
+
+    def release(self) -> None:
+        """Gives up a probe that ended without telling anything about the API."""
+
+        if self.state == "half-open":
+            self.state = "open"
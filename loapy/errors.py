@@ -44,3 +44,15 @@ class GatewayTimeout(LostArkError):
     """Raised when the API returns a 504 Gateway Timeout response."""
 
     pass
+
+
+class QuotaExceeded(LostArkError):
+    """Raised when a tenant exceeds its share of a QuotaBudget."""
+
+    pass
+
+
+class CircuitOpen(LostArkError):
+    """Raised when requests to an endpoint family are stopped by its circuit breaker."""
+
+    pass
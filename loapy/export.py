@@ -0,0 +1,373 @@
+from __future__ import annotations  # for postponed evaluation of annotations
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+    from typing_extensions import Self
+
+    from .types.armories import ArmoryCard, ArmoryEquipment, ArmoryGem, ArmoryProfile
+    from .types.auctions import Auction, AuctionItem
+    from .types.markets import MarketItem, MarketList
+
+ColumnType = Literal["string", "int64", "float64", "bool"]
+Row = Tuple[Any, ...]
+
+
+class Table(NamedTuple):
+    name: str
+    columns: Tuple[Tuple[str, ColumnType], ...]
+    flatten: Callable[..., Iterable[Row]]
+
+
+def _level(value: Optional[str]) -> Optional[float]:
+    # Item levels are formatted with thousands separators, e.g. "1,620.00"
+    return None if not value else float(value.replace(",", ""))
+
+
+def _int(value: Optional[str]) -> Optional[int]:
+    return None if not value else int(value.replace(",", ""))
+
+
+def _profiles(profile: ArmoryProfile) -> Iterable[Row]:
+    yield (
+        profile["CharacterName"],
+        profile["ServerName"],
+        profile["CharacterClassName"],
+        profile["CharacterLevel"],
+        _level(profile["ItemAvgLevel"]),
+        _level(profile["ItemMaxLevel"]),
+        profile["ExpeditionLevel"],
+        profile["TownLevel"],
+        profile["TownName"],
+        profile["Title"],
+        profile["GuildName"],
+        profile["GuildMemberGrade"],
+        profile["PvpGradeName"],
+        profile["UsingSkillPoint"],
+        profile["TotalSkillPoint"],
+    )
+
+
+def _stats(profile: ArmoryProfile) -> Iterable[Row]:
+    for stat in profile["Stats"] or []:
+        yield profile["CharacterName"], stat["Type"], _int(stat["Value"])
+
+
+def _equipment(
+    equipment: List[ArmoryEquipment], *, character_name: str
+) -> Iterable[Row]:
+    for item in equipment or []:
+        yield character_name, item["Type"], item["Name"], item["Grade"], item["Icon"]
+
+
+def _gems(gems: Optional[ArmoryGem], *, character_name: str) -> Iterable[Row]:
+    # Characters without gems or cards get null instead of an empty object
+    for gem in (gems or {}).get("Gems") or []:
+        yield character_name, gem["Slot"], gem["Name"], gem["Level"], gem["Grade"]
+
+
+def _cards(cards: Optional[ArmoryCard], *, character_name: str) -> Iterable[Row]:
+    for card in (cards or {}).get("Cards") or []:
+        yield (
+            character_name,
+            card["Slot"],
+            card["Name"],
+            card["AwakeCount"],
+            card["AwakeTotal"],
+            card["Grade"],
+        )
+
+
+def _auction_items(auction: Union[Auction, List[AuctionItem]]) -> Iterable[Row]:
+    items = (auction["Items"] or []) if isinstance(auction, dict) else auction
+
+    for item in items:
+        info = item["AuctionInfo"]
+
+        yield (
+            item["Name"],
+            item["Grade"],
+            item["Tier"],
+            item["Level"],
+            item["GradeQuality"],
+            info["StartPrice"],
+            info["BuyPrice"],
+            info["BidPrice"],
+            info["BidStartPrice"],
+            info["BidCount"],
+            info["EndDate"],
+            info["IsCompetitive"],
+            info["TradeAllowCount"],
+        )
+
+
+def _market_items(market: Union[MarketList, List[MarketItem]]) -> Iterable[Row]:
+    items = (market["Items"] or []) if isinstance(market, dict) else market
+
+    for item in items:
+        yield (
+            item["Id"],
+            item["Name"],
+            item["Grade"],
+            item["BundleCount"],
+            item["TradeRemainCount"],
+            item["YDayAvgPrice"],
+            item["RecentPrice"],
+            item["CurrentMinPrice"],
+        )
+
+
+PROFILES = Table(
+    "profiles",
+    (
+        ("CharacterName", "string"),
+        ("ServerName", "string"),
+        ("CharacterClassName", "string"),
+        ("CharacterLevel", "int64"),
+        ("ItemAvgLevel", "float64"),
+        ("ItemMaxLevel", "float64"),
+        ("ExpeditionLevel", "int64"),
+        ("TownLevel", "int64"),
+        ("TownName", "string"),
+        ("Title", "string"),
+        ("GuildName", "string"),
+        ("GuildMemberGrade", "string"),
+        ("PvpGradeName", "string"),
+        ("UsingSkillPoint", "int64"),
+        ("TotalSkillPoint", "int64"),
+    ),
+    _profiles,
+)
+
+STATS = Table(
+    "stats",
+    (("CharacterName", "string"), ("Type", "string"), ("Value", "int64")),
+    _stats,
+)
+
+EQUIPMENT = Table(
+    "equipment",
+    (
+        ("CharacterName", "string"),
+        ("Type", "string"),
+        ("Name", "string"),
+        ("Grade", "string"),
+        ("Icon", "string"),
+    ),
+    _equipment,
+)
+
+GEMS = Table(
+    "gems",
+    (
+        ("CharacterName", "string"),
+        ("Slot", "int64"),
+        ("Name", "string"),
+        ("Level", "int64"),
+        ("Grade", "string"),
+    ),
+    _gems,
+)
+
+CARDS = Table(
+    "cards",
+    (
+        ("CharacterName", "string"),
+        ("Slot", "int64"),
+        ("Name", "string"),
+        ("AwakeCount", "int64"),
+        ("AwakeTotal", "int64"),
+        ("Grade", "string"),
+    ),
+    _cards,
+)
+
+AUCTION_ITEMS = Table(
+    "auction_items",
+    (
+        ("Name", "string"),
+        ("Grade", "string"),
+        ("Tier", "int64"),
+        ("Level", "int64"),
+        ("GradeQuality", "int64"),
+        ("StartPrice", "int64"),
+        ("BuyPrice", "int64"),
+        ("BidPrice", "int64"),
+        ("BidStartPrice", "int64"),
+        ("BidCount", "int64"),
+        ("EndDate", "string"),
+        ("IsCompetitive", "bool"),
+        ("TradeAllowCount", "int64"),
+    ),
+    _auction_items,
+)
+
+MARKET_ITEMS = Table(
+    "market_items",
+    (
+        ("Id", "int64"),
+        ("Name", "string"),
+        ("Grade", "string"),
+        ("BundleCount", "int64"),
+        ("TradeRemainCount", "int64"),
+        ("YDayAvgPrice", "float64"),
+        ("RecentPrice", "int64"),
+        ("CurrentMinPrice", "int64"),
+    ),
+    _market_items,
+)
+
+
+def _pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for record batches, "
+            "install it with `python -m pip install 'loapy[export]'`"
+        ) from e
+
+    return pyarrow
+
+
+class RecordBatchBuilder:
+    """Accumulates flattened responses of a table column by column."""
+
+    __slots__ = ("table", "__columns")
+
+    def __init__(self, table: Table) -> None:
+        self.table = table
+
+        self.__columns: List[List[Any]] = [[] for _ in table.columns]
+
+    def __len__(self) -> int:
+        return len(self.__columns[0])
+
+    def append(self, value: Any, **context: Any) -> int:
+        """Flattens a response into rows, returning the number of rows added."""
+
+        appends = [column.append for column in self.__columns]
+        count = 0
+
+        for row in self.table.flatten(value, **context):
+            for append, cell in zip(appends, row):
+                append(cell)
+
+            count += 1
+
+        return count
+
+    def clear(self) -> None:
+        for column in self.__columns:
+            column.clear()
+
+    def to_pydict(self) -> Dict[str, List[Any]]:
+        return {
+            name: list(column)
+            for (name, _), column in zip(self.table.columns, self.__columns)
+        }
+
+    def schema(self) -> Any:
+        """Returns the pyarrow schema of the table."""
+
+        pa = _pyarrow()
+
+        types = {
+            "string": pa.string(),
+            "int64": pa.int64(),
+            "float64": pa.float64(),
+            "bool": pa.bool_(),
+        }
+
+        return pa.schema([(name, types[type_]) for name, type_ in self.table.columns])
+
+    def to_record_batch(self) -> Any:
+        """Returns the accumulated rows as a pyarrow RecordBatch."""
+
+        pa = _pyarrow()
+        schema = self.schema()
+
+        return pa.RecordBatch.from_arrays(
+            [
+                pa.array(column, type=field.type)
+                for column, field in zip(self.__columns, schema)
+            ],
+            schema=schema,
+        )
+
+
+class ColumnarWriter:
+    """Streams responses of a table to a Parquet or Arrow IPC file.
+
+    Rows are buffered until ``batch_size`` of them are accumulated, then
+    written as a record batch, so memory stays bounded during a crawl.
+    """
+
+    __slots__ = ("path", "format", "batch_size", "__builder", "__writer")
+
+    def __init__(
+        self,
+        path: Union[str, PathLike],
+        table: Table,
+        *,
+        format: Literal["parquet", "arrow"] = "parquet",
+        batch_size: int = 65536,
+    ) -> None:
+        self.path = path
+        self.format = format
+        self.batch_size = batch_size
+
+        self.__builder = RecordBatchBuilder(table)
+        self.__writer: Any = None
+
+    def write(self, value: Any, **context: Any) -> None:
+        self.__builder.append(value, **context)
+
+        if len(self.__builder) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not len(self.__builder):
+            return
+
+        batch = self.__builder.to_record_batch()
+
+        if self.__writer is None:
+            pa = _pyarrow()
+
+            if self.format == "parquet":
+                import pyarrow.parquet
+
+                self.__writer = pyarrow.parquet.ParquetWriter(self.path, batch.schema)
+            else:
+                self.__writer = pa.ipc.new_file(self.path, batch.schema)
+
+        self.__writer.write_batch(batch)
+        self.__builder.clear()
+
+    def close(self) -> None:
+        self.flush()
+
+        if self.__writer is not None:
+            self.__writer.close()
+            self.__writer = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
@@ -0,0 +1,188 @@
+from __future__ import annotations  # for postponed evaluation of annotations
+
+from asyncio import CancelledError, Queue, QueueFull, Task, create_task, gather, sleep
+from logging import getLogger
+from typing import TYPE_CHECKING, List, Literal, NamedTuple, Optional, Set, Tuple, Union
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from .http import LostArkRest
+    from .types.news import Event, Notice
+
+logger = getLogger("loapy.feed")
+
+
+class FeedItem(NamedTuple):
+    kind: Literal["notice", "event"]
+    item: Union[Notice, Event]
+
+
+class Subscription:
+    """New notices and events of a feed, iterated asynchronously."""
+
+    __slots__ = ("feed", "queue", "ended")
+
+    def __init__(self, feed: NewsFeed, maxsize: int = 0) -> None:
+        self.feed = feed
+        # None marks the end of the feed
+        self.queue: Queue[Optional[FeedItem]] = Queue(maxsize)
+        self.ended = False
+
+    def close(self) -> None:
+        self.feed.unsubscribe(self)
+
+    def end(self) -> None:
+        """Stops the iteration once the queued items are consumed."""
+
+        self.ended = True
+
+        try:
+            self.queue.put_nowait(None)
+        except QueueFull:
+            # A full queue has no waiting reader, which checks ``ended`` instead
+            pass
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> FeedItem:
+        if self.ended and self.queue.empty():
+            raise StopAsyncIteration
+
+        item = await self.queue.get()
+
+        if item is None:
+            raise StopAsyncIteration
+
+        return item
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        self.close()
+
+
+class NewsFeed:
+    """Polls notices and events once and fans new posts out to every subscriber.
+
+    The poller runs while there is a subscriber. The interval shrinks towards
+    ``min_interval`` while new posts keep arriving and grows towards
+    ``max_interval`` while nothing changes. Posts present at the first poll
+    are not published.
+    """
+
+    __slots__ = (
+        "rest",
+        "interval",
+        "min_interval",
+        "max_interval",
+        "__subscribers",
+        "__seen",
+        "__task",
+    )
+
+    def __init__(
+        self,
+        rest: LostArkRest,
+        *,
+        interval: float = 60.0,
+        min_interval: float = 15.0,
+        max_interval: float = 300.0,
+    ) -> None:
+        self.rest = rest
+        self.interval = interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+
+        self.__subscribers: List[Subscription] = []
+        self.__seen: Optional[Set[Tuple[str, str, str]]] = None
+        self.__task: Optional[Task] = None
+
+    def subscribe(self, *, maxsize: int = 0) -> Subscription:
+        """Returns a new subscription, starting the poller if needed."""
+
+        subscription = Subscription(self, maxsize)
+        self.__subscribers.append(subscription)
+
+        if self.__task is None or self.__task.done():
+            self.__task = create_task(self.__poll())
+
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Removes a subscription, stopping the poller if it was the last one."""
+
+        if subscription in self.__subscribers:
+            self.__subscribers.remove(subscription)
+
+        subscription.end()
+
+        if not self.__subscribers:
+            self.stop()
+
+    def stop(self) -> None:
+        """Stops the poller and ends every subscription."""
+
+        if self.__task is not None and not self.__task.done():
+            self.__task.cancel()
+
+        self.__task = None
+
+        for subscription in self.__subscribers:
+            subscription.end()
+
+        self.__subscribers.clear()
+
+    def __publish(self, notices: List[Notice], events: List[Event]) -> int:
+        items = [
+            *(
+                (("notice", notice["Link"], notice["Date"]), FeedItem("notice", notice))
+                for notice in notices
+            ),
+            *(
+                (("event", event["Link"], event["StartDate"]), FeedItem("event", event))
+                for event in events
+            ),
+        ]
+
+        seen, self.__seen = self.__seen, {key for key, _ in items}
+
+        if seen is None:
+            return 0
+
+        new = [item for key, item in reversed(items) if key not in seen]
+
+        for subscription in self.__subscribers:
+            for item in new:
+                try:
+                    subscription.queue.put_nowait(item)
+                except QueueFull:
+                    logger.warning("Subscription queue is full, dropping a feed item")
+
+        return len(new)
+
+    async def __poll(self) -> None:
+        while self.__subscribers:
+            try:
+                notices, events = await gather(
+                    self.rest.fetch_notices(), self.rest.fetch_events()
+                )
+            except CancelledError:
+                raise
+            except Exception as e:
+                # The poller is shared, so it backs off rather than dying
+                logger.warning(f"Failed to poll the news feed: {e!r}")
+                new = 0
+            else:
+                new = self.__publish(notices, events)
+
+            if new:
+                self.interval = max(self.interval / 2, self.min_interval)
+            else:
+                self.interval = min(self.interval * 1.5, self.max_interval)
+
+            logger.debug(f"Published {new} feed items, next poll in {self.interval}s")
+
+            await sleep(self.interval)
@@ -0,0 +1,49 @@
+from collections import deque
+from math import ceil
+
+
+class HedgePolicy:
+    """Decides when a slow idempotent request deserves a second attempt.
+
+    The hedge is sent once the first attempt has been running longer than the
+    ``percentile`` of recently observed latencies, clamped between
+    ``min_delay`` and ``max_delay``, and only while more than ``reserve``
+    requests are left in the rate limit window.
+    """
+
+    __slots__ = ("percentile", "min_delay", "max_delay", "reserve", "__latencies")
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 0.95,
+        min_delay: float = 0.05,
+        max_delay: float = 2.0,
+        reserve: int = 10,
+        window: int = 256,
+    ) -> None:
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.reserve = reserve
+
+        self.__latencies: deque[float] = deque(maxlen=window)
+
+    def observe(self, latency: float) -> None:
+        self.__latencies.append(latency)
+
+    @property
+    def delay(self) -> float:
+        # Too few samples make a meaningless percentile, so wait the longest
+        if len(self.__latencies) < 16:
+            return self.max_delay
+
+        latencies = sorted(self.__latencies)
+        value = latencies[
+            min(ceil(len(latencies) * self.percentile), len(latencies)) - 1
+        ]
+
+        return min(max(value, self.min_delay), self.max_delay)
+
+    def allows(self, spare: int) -> bool:
+        return spare > self.reserve
@@ -1,69 +1,139 @@
-from asyncio import Future, create_task, sleep
-from collections import deque
+from __future__ import annotations  # for postponed evaluation of annotations
+
+from asyncio import FIRST_COMPLETED, Future, create_task, sleep, wait
+from collections import OrderedDict, deque
+from email.utils import parsedate_to_datetime
 from logging import getLogger
-from time import time
-from typing import Any, ClassVar, List, Literal, Mapping, Optional
+from time import monotonic, time
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+)
 
 import ujson
-from aiohttp import BaseConnector, ClientResponse, ClientSession
-from typing_extensions import Self
 
 from . import __version__
+from .circuit import CircuitBreaker
 from .errors import (
     BadGateway,
+    CircuitOpen,
     Forbidden,
     GatewayTimeout,
     InternalServerError,
     LostArkError,
     NotFound,
+    QuotaExceeded,
     ServiceUnavailable,
     Unauthorized,
 )
-from .types.armories import (
-    ArmoryAvatar,
-    ArmoryCard,
-    ArmoryEngraving,
-    ArmoryEquipment,
-    ArmoryGem,
-    ArmoryProfile,
-    ArmorySkill,
-    Character,
-    Collectible,
-    ColosseumInfo,
-)
-from .types.auctions import Auction, AuctionOption, RequestAuctionItems
-from .types.characters import CharacterInfo
-from .types.gamecontents import (
-    ChallengeAbyssDungeon,
-    ChallengeGuardianRaid,
-    ContentsCalendar,
-)
-from .types.guilds import GuildRanking
-from .types.markets import MarketItem, MarketList, MarketOption, RequestMarketItems
-from .types.news import Event, Notice, NoticeType
+from .feed import NewsFeed
+from .hedging import HedgePolicy
+from .names import character_key
+from .quota import QuotaBudget, current_tenant
+from .transport import AiohttpTransport, Transport, TransportResponse
+
+if TYPE_CHECKING:
+    from aiohttp import BaseConnector
+    from typing_extensions import Self
+
+    from .types.armories import (
+        ArmoryAvatar,
+        ArmoryCard,
+        ArmoryEngraving,
+        ArmoryEquipment,
+        ArmoryGem,
+        ArmoryProfile,
+        ArmorySkill,
+        Character,
+        Collectible,
+        ColosseumInfo,
+    )
+    from .types.auctions import Auction, AuctionOption, RequestAuctionItems
+    from .types.characters import CharacterInfo
+    from .types.gamecontents import (
+        ChallengeAbyssDungeon,
+        ChallengeGuardianRaid,
+        ContentsCalendar,
+    )
+    from .types.guilds import GuildRanking, ServerName
+    from .types.markets import (
+        MarketItemStats,
+        MarketList,
+        MarketOption,
+        RequestMarketItems,
+    )
+    from .types.news import Event, Notice, NoticeType
 
 logger = getLogger("loapy.http")
 
+MISSING: Any = object()
+
+SERVER_ERRORS = (InternalServerError, BadGateway, ServiceUnavailable, GatewayTimeout)
+
 
 class RateLimit:
+    MIN_MARGIN: ClassVar[float] = 0.05
+    MAX_MARGIN: ClassVar[float] = 5.0
+
     def __init__(self) -> None:
         self.limit: int = 1
+        self.limit_loaded: bool = False
         self.remaining: int = 1
-        self.reset_at: Optional[int] = None
+        # Deadline of the current window on the monotonic clock
+        self.reset_at: Optional[float] = None
 
         self.loaded: bool = False
         self.pending: int = 0
 
+        # Estimated server clock minus local wall clock, in seconds
+        self.offset: float = 0.0
+        # Safety margin added after the expected reset, adapted to observed 429s
+        self.margin: float = 1.0
+
+        self.__synced: bool = False
+        self.__violated: bool = False
+        self.__woken: bool = False
+
         self.__queue: deque[Future] = deque()
         self.__waiting: Optional[Future] = None
 
     @property
     def expired(self) -> bool:
-        return self.reset_at is not None and self.reset_at <= time()
+        # The margin compensates for the remaining error of the estimated reset
+        return self.reset_at is not None and self.reset_at + self.margin <= monotonic()
+
+    def __sync(self, date: str) -> None:
+        try:
+            server = parsedate_to_datetime(date).timestamp()
+        except (TypeError, ValueError):
+            return
+
+        # Date header is truncated to seconds, so the midpoint is the best guess
+        sample = server + 0.5 - time()
+
+        if self.__synced:
+            self.offset += (sample - self.offset) * 0.2
+        else:
+            self.offset = sample
+            self.__synced = True
+
+    def __deadline(self, timestamp: float) -> float:
+        return monotonic() + timestamp - (time() + self.offset)
+
+    def update(self, response: TransportResponse) -> None:
+        if "Date" in response.headers:
+            self.__sync(response.headers["Date"])
 
-    def update(self, response: ClientResponse) -> None:
         if "X-RateLimit-Limit" in response.headers:
             self.limit = int(response.headers["X-RateLimit-Limit"])
+            self.limit_loaded = True
 
         if "X-RateLimit-Remaining" in response.headers:
             remaining = int(response.headers["X-RateLimit-Remaining"])
@@ -71,15 +141,24 @@ class RateLimit:
             if self.loaded:
                 self.remaining = min(remaining, self.limit - self.pending)
             else:
-                self.remaining = int(response.headers["X-RateLimit-Remaining"])
+                if self.__woken and remaining < self.limit - self.pending:
+                    # The server window had not been reset yet when we resumed
+                    self.margin = min(self.margin * 1.5, self.MAX_MARGIN)
+
+                self.remaining = remaining
                 self.loaded = True
 
+            self.__woken = False
+
         if "X-RateLimit-Reset" in response.headers:
-            self.reset_at = int(response.headers["X-RateLimit-Reset"])
+            self.reset_at = self.__deadline(int(response.headers["X-RateLimit-Reset"]))
 
         if response.status == 429:
             self.remaining = 0
-            self.reset_at = int(time()) + int(response.headers["Retry-After"])
+            self.reset_at = monotonic() + int(response.headers.get("Retry-After", 60))
+
+            self.__violated = True
+            self.margin = min(self.margin * 2, self.MAX_MARGIN)
 
             logger.info(
                 "Unexpected rate limit exceeded, remaining capacity initialized"
@@ -91,10 +170,22 @@ class RateLimit:
             )
 
     def reset(self) -> None:
+        if not self.__violated:
+            self.margin = max(self.margin * 0.75, self.MIN_MARGIN)
+
         self.remaining = self.limit - self.pending
         self.reset_at = None
         self.loaded = False
 
+        self.__violated = False
+        self.__woken = True
+
+    @property
+    def spare(self) -> int:
+        """Number of requests that can start now without waiting."""
+
+        return self.remaining - len(self.__queue)
+
     def __run(self, length: int = 1) -> None:
         x = 0
         while self.__queue:
@@ -124,8 +215,7 @@ class RateLimit:
         if self.reset_at is None:
             return
 
-        # Compensates for unknown error between X-RateLimit-Reset and actual reset time
-        await sleep(self.reset_at - time() + 1)
+        await sleep(self.reset_at + self.margin - monotonic())
 
         self.reset()
         self.__run(self.remaining)
@@ -143,20 +233,87 @@ class RateLimit:
 class LostArkRest:
     BASE: ClassVar[str] = "https://developer-lostark.game.onstove.com"
 
-    __slots__ = ("token", "__connector", "__session", "__ratelimit")
+    __slots__ = (
+        "token",
+        "__transport",
+        "__ratelimit",
+        "__feed",
+        "__hedging",
+        "__budget",
+        "__circuits",
+        "__threshold",
+        "__cooldown",
+        "__stale",
+        "__stale_size",
+    )
 
     def __init__(
-        self, token: str, *, connector: Optional[BaseConnector] = None
+        self,
+        token: str,
+        *,
+        connector: Optional[BaseConnector] = None,
+        transport: Optional[Transport] = None,
+        hedging: Optional[HedgePolicy] = None,
+        budget: Optional[QuotaBudget] = None,
+        circuit_threshold: int = 5,
+        circuit_cooldown: float = 30.0,
+        stale_size: int = 0,
     ) -> None:
         self.token = token
+        self.__hedging = hedging
+        self.__budget = budget
+
+        self.__circuits: Dict[str, CircuitBreaker] = {}
+        self.__threshold = circuit_threshold
+        self.__cooldown = circuit_cooldown
 
-        self.__connector: Optional[BaseConnector] = connector
+        # Last successful GET responses, served while their API is failing
+        self.__stale: OrderedDict[tuple, Any] = OrderedDict()
+        self.__stale_size = stale_size
 
-        self.__session: Optional[ClientSession] = None
+        self.__transport: Transport = (
+            transport
+            if transport is not None
+            else AiohttpTransport(self.BASE, connector=connector)
+        )
         self.__ratelimit: RateLimit = RateLimit()
+        self.__feed: Optional[NewsFeed] = None
+
+        if budget is not None:
+            budget.bind(self.__ratelimit)
+
+    @property
+    def feed(self) -> NewsFeed:
+        """Returns the change feed of notices and events shared by this client."""
+
+        if self.__feed is None:
+            self.__feed = NewsFeed(self)
+
+        return self.__feed
+
+    @property
+    def circuits(self) -> Mapping[str, CircuitBreaker]:
+        """Returns the circuit breakers by endpoint family, e.g. ``armories``."""
+
+        return MappingProxyType(self.__circuits)
+
+    def __circuit(self, endpoint: str) -> CircuitBreaker:
+        family = endpoint.strip("/").split("/", 1)[0]
+
+        if family not in self.__circuits:
+            self.__circuits[family] = CircuitBreaker(
+                family, threshold=self.__threshold, cooldown=self.__cooldown
+            )
+
+        return self.__circuits[family]
+
+    async def close(self) -> None:
+        """Closes the underlying transport."""
 
-    def __create_session(self) -> ClientSession:
-        return ClientSession(self.BASE, connector=self.__connector)
+        if self.__feed is not None:
+            self.__feed.stop()
+
+        await self.__transport.close()
 
     async def request(
         self,
@@ -165,47 +322,151 @@ class LostArkRest:
         *,
         json: Any = None,
         params: Optional[Mapping[str, str]] = None,
+        tenant: Optional[str] = None,
     ):
-        if self.__session is None:
-            self.__session = self.__create_session()
+        if tenant is None:
+            tenant = current_tenant.get()
+
+        circuit = self.__circuit(endpoint)
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        # Taken up front, as a concurrent request may evict it while this one runs
+        stale = self.__stale.get(key, MISSING) if method == "GET" else MISSING
+
+        if not circuit.allow():
+            if stale is not MISSING:
+                logger.debug(f"{method} {endpoint} served from stale cache")
+                return stale
+
+            raise CircuitOpen(f"Circuit of {circuit.name} is open")
+
+        try:
+            if self.__hedging is not None and method == "GET":
+                result = await self.__hedge(method, endpoint, json, params, tenant)
+            else:
+                result = await self.__send(method, endpoint, json, params, tenant)
+        except SERVER_ERRORS:
+            circuit.failure()
+
+            if stale is not MISSING:
+                logger.debug(f"{method} {endpoint} failed, served from stale cache")
+                return stale
+
+            raise
+        except QuotaExceeded:
+            circuit.release()
+            raise
+        except LostArkError:
+            # Any other answer means the API itself is up
+            circuit.success()
+            raise
+        except BaseException:
+            circuit.release()
+            raise
+
+        circuit.success()
+
+        if method == "GET" and self.__stale_size > 0:
+            self.__stale[key] = result
+            self.__stale.move_to_end(key)
+
+            if len(self.__stale) > self.__stale_size:
+                self.__stale.popitem(last=False)
+
+        return result
+
+    async def __hedge(
+        self,
+        method: Literal["GET", "POST"],
+        endpoint: str,
+        json: Any,
+        params: Optional[Mapping[str, str]],
+        tenant: str,
+    ):
+        assert self.__hedging is not None
+
+        tasks = {create_task(self.__send(method, endpoint, json, params, tenant))}
+
+        try:
+            done, _ = await wait(tasks, timeout=self.__hedging.delay)
+
+            if not done and self.__hedging.allows(self.__ratelimit.spare):
+                logger.debug(f"{method} {endpoint} is slow, sending a hedged request")
+
+                tasks.add(
+                    create_task(self.__send(method, endpoint, json, params, tenant))
+                )
+
+            while True:
+                done, tasks = await wait(tasks, return_when=FIRST_COMPLETED)
+
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+
+                # Every finished attempt failed, but a pending one may still succeed
+                if not tasks:
+                    return done.pop().result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def __send(
+        self,
+        method: Literal["GET", "POST"],
+        endpoint: str,
+        json: Any,
+        params: Optional[Mapping[str, str]],
+        tenant: str,
+    ):
+        headers = {
+            "Accept": "application/json",
+            "Authorization": f"Bearer {self.token}",
+            "User-Agent": f"Loapy (https://github.com/korlark/loapy) {__version__}",
+        }
+
+        if json is not None:
+            headers["Content-Type"] = "application/json"
+
+        if self.__budget is not None:
+            await self.__budget.acquire(tenant)
 
         async with self.__ratelimit:
-            async with self.__session.request(
+            started = monotonic()
+
+            response = await self.__transport.request(
                 method,
                 endpoint,
-                headers={
-                    "Accept": "application/json",
-                    "Authorization": f"Bearer {self.token}",
-                    "User-Agent": f"Loapy (https://github.com/korlark/loapy) {__version__}",
-                },
-                data=None if json is not None else ujson.dumps(json),
+                headers=headers,
+                data=None if json is None else ujson.dumps(json),
                 params=params,
-            ) as response:
-                logger.debug(f"{method} {endpoint} returned {response.status}")
-
-                self.__ratelimit.update(response)
-
-                if response.status == 200:
-                    body = await response.text()
-
-                    return ujson.loads(body)
-
-                elif response.status == 401:
-                    raise Unauthorized()
-                elif response.status == 403:
-                    raise Forbidden()
-                elif response.status == 404:
-                    raise NotFound()
-                elif response.status == 500:
-                    raise InternalServerError()
-                elif response.status == 502:
-                    raise BadGateway()
-                elif response.status == 503:
-                    raise ServiceUnavailable()
-                elif response.status == 504:
-                    raise GatewayTimeout()
-                else:
-                    raise LostArkError(f"Unexpected status code: {response.status}")
+            )
+
+            if self.__hedging is not None:
+                self.__hedging.observe(monotonic() - started)
+
+            logger.debug(f"{method} {endpoint} returned {response.status}")
+
+            self.__ratelimit.update(response)
+
+            if response.status == 200:
+                return ujson.loads(response.body)
+
+            elif response.status == 401:
+                raise Unauthorized()
+            elif response.status == 403:
+                raise Forbidden()
+            elif response.status == 404:
+                raise NotFound()
+            elif response.status == 500:
+                raise InternalServerError()
+            elif response.status == 502:
+                raise BadGateway()
+            elif response.status == 503:
+                raise ServiceUnavailable()
+            elif response.status == 504:
+                raise GatewayTimeout()
+            else:
+                raise LostArkError(f"Unexpected status code: {response.status}")
 
     # https://developer-lostark.game.onstove.com/getting-started#API-NEWS
 
@@ -233,7 +494,9 @@ class LostArkRest:
     async def fetch_characters(self, character_name: str) -> List[CharacterInfo]:
         """Returns all character profiles for an account."""
 
-        return await self.request("GET", f"/characters/{character_name}/siblings")
+        return await self.request(
+            "GET", f"/characters/{character_key(character_name)}/siblings"
+        )
 
     # https://developer-lostark.game.onstove.com/getting-started#API-ARMORIES
 
@@ -272,7 +535,7 @@ class LostArkRest:
 
         return await self.request(
             "GET",
-            f"/armories/characters/{character_name}",
+            f"/armories/characters/{character_key(character_name)}",
             params={"filter": "+".join(filters)},
         )
 
@@ -280,58 +543,62 @@ class LostArkRest:
         """Returns a summary of the basic stats by a character name."""
 
         return await self.request(
-            "GET", f"/armories/characters/{character_name}/profiles"
+            "GET", f"/armories/characters/{character_key(character_name)}/profiles"
         )
 
     async def fetch_equipment(self, character_name: str) -> List[ArmoryEquipment]:
         """Returns a summary of the items equipped by a character name."""
         return await self.request(
-            "GET", f"/armories/characters/{character_name}/equipment"
+            "GET", f"/armories/characters/{character_key(character_name)}/equipment"
         )
 
     async def fetch_avatars(self, character_name: str) -> List[ArmoryAvatar]:
         """Returns a summary of the avatars equipped by a character name."""
 
         return await self.request(
-            "GET", f"/armories/characters/{character_name}/avatars"
+            "GET", f"/armories/characters/{character_key(character_name)}/avatars"
         )
 
     async def fetch_combat_skills(self, character_name: str) -> List[ArmorySkill]:
         """Returns a summary of the combat skills by a character name."""
 
         return await self.request(
-            "GET", f"/armories/characters/{character_name}/combat-skills"
+            "GET", f"/armories/characters/{character_key(character_name)}/combat-skills"
         )
 
     async def fetch_engravings(self, character_name: str) -> ArmoryEngraving:
         """Returns a summary of the engravings equipped by a character name."""
 
         return await self.request(
-            "GET", f"/armories/characters/{character_name}/engravings"
+            "GET", f"/armories/characters/{character_key(character_name)}/engravings"
         )
 
     async def fetch_cards(self, character_name: str) -> ArmoryCard:
         """Returns a summary of the cards equipped by a character name."""
 
-        return await self.request("GET", f"/armories/characters/{character_name}/cards")
+        return await self.request(
+            "GET", f"/armories/characters/{character_key(character_name)}/cards"
+        )
 
     async def fetch_gems(self, character_name: str) -> ArmoryGem:
         """Returns a summary of the gems equipped by a character name."""
 
-        return await self.request("GET", f"/armories/characters/{character_name}/gems")
+        return await self.request(
+            "GET", f"/armories/characters/{character_key(character_name)}/gems"
+        )
 
     async def fetch_colosseums(self, character_name: str) -> ColosseumInfo:
         """Returns a summary of the proving grounds by a character name."""
 
         return await self.request(
-            "GET", f"/armories/characters/{character_name}/colosseums"
+            "GET", f"/armories/characters/{character_key(character_name)}/colosseums"
         )
 
     async def fetch_collectibles(self, character_name: str) -> List[Collectible]:
         """Returns a summary of the collectibles by a character name."""
 
         return await self.request(
-            "GET", f"/armories/characters/{character_name}/collectibles"
+            "GET", f"/armories/characters/{character_key(character_name)}/collectibles"
         )
 
     # https://developer-lostark.game.onstove.com/getting-started#API-AUCTIONS
@@ -356,7 +623,7 @@ class LostArkRest:
 
     async def fetch_guilds(
         self,
-        server_name: Literal["루페온", "실리안", "아만", "카마인", "카제로스", "아브렐슈드", "카단", "니나브"],
+        server_name: ServerName,
     ) -> List[GuildRanking]:
         """Returns a list of guild rankings by a server."""
 
@@ -371,14 +638,14 @@ class LostArkRest:
 
         return await self.request("GET", "/markets/options")
 
-    async def fetch_market_item(self, item_id: int) -> List[MarketItem]:
-        """Returns a market item by ID."""
+    async def fetch_market_item(self, item_id: int) -> List[MarketItemStats]:
+        """Returns the price history of a market item by ID."""
 
         return await self.request("GET", f"/markets/items/{item_id}")
 
     async def fetch_market_items(
         self, request_market_items: RequestMarketItems
-    ) -> List[MarketList]:
+    ) -> MarketList:
         """Returns a list of market items by search options."""
 
         return await self.request(
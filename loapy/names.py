@@ -0,0 +1,14 @@
+from functools import lru_cache
+from unicodedata import normalize
+from urllib.parse import quote
+
+
+@lru_cache(maxsize=4096)
+def character_key(character_name: str) -> str:
+    """Returns the canonical path segment of a character name.
+
+    Names are trimmed, NFC normalized and percent-encoded, so the same
+    character always maps to the same endpoint and is not quoted again.
+    """
+
+    return quote(normalize("NFC", character_name.strip()), safe="")
@@ -0,0 +1,216 @@
+from __future__ import annotations  # for postponed evaluation of annotations
+
+from asyncio import gather
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
+
+import ujson
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+    from .http import LostArkRest
+    from .types.auctions import AuctionOption, RequestAuctionItems
+    from .types.markets import MarketOption, RequestMarketItems
+
+ENGRAVING = "각인 효과"
+
+
+class OptionIndex:
+    """Lookup tables built from auction and market search options.
+
+    Every name to code lookup is a single dictionary access, so search
+    payloads can be built and validated without walking the option trees.
+    """
+
+    __slots__ = (
+        "auction",
+        "market",
+        "auction_categories",
+        "auction_category_codes",
+        "market_categories",
+        "market_category_codes",
+        "grades",
+        "tiers",
+        "classes",
+        "skills",
+        "skill_codes",
+        "tripods",
+        "tripod_codes",
+        "etc",
+        "etc_codes",
+        "etc_subs",
+        "etc_sub_codes",
+    )
+
+    def __init__(
+        self,
+        auction: Optional[AuctionOption] = None,
+        market: Optional[MarketOption] = None,
+    ) -> None:
+        self.auction = auction
+        self.market = market
+
+        # Auction and market category codes are separate and may collide
+        self.auction_categories: Dict[int, str] = {}
+        self.auction_category_codes: Dict[str, int] = {}
+        self.market_categories: Dict[int, str] = {}
+        self.market_category_codes: Dict[str, int] = {}
+        self.grades: Set[str] = set()
+        self.tiers: Set[int] = set()
+        self.classes: Set[str] = set()
+
+        self.skills: Dict[int, str] = {}
+        self.skill_codes: Dict[Tuple[str, str], int] = {}
+        self.tripods: Dict[Tuple[int, int], str] = {}
+        self.tripod_codes: Dict[Tuple[int, str], int] = {}
+
+        self.etc: Dict[int, str] = {}
+        self.etc_codes: Dict[str, int] = {}
+        self.etc_subs: Dict[Tuple[int, int], str] = {}
+        self.etc_sub_codes: Dict[Tuple[int, str], int] = {}
+
+        for options, categories, codes in [
+            (auction, self.auction_categories, self.auction_category_codes),
+            (market, self.market_categories, self.market_category_codes),
+        ]:
+            if options is None:
+                continue
+
+            self.grades.update(options["ItemGrades"])
+            self.tiers.update(options["ItemTiers"])
+            self.classes.update(options["Classes"])
+
+            for category in options["Categories"]:
+                for item in [category, *category["Subs"]]:
+                    categories[item["Code"]] = item["CodeName"]
+                    codes.setdefault(item["CodeName"], item["Code"])
+
+        if auction is not None:
+            for skill in auction["SkillOptions"]:
+                self.skills[skill["Value"]] = skill["Text"]
+                self.skill_codes[(skill["Class"], skill["Text"])] = skill["Value"]
+
+                for tripod in skill["Tripods"]:
+                    self.tripods[(skill["Value"], tripod["Value"])] = tripod["Text"]
+                    self.tripod_codes[(skill["Value"], tripod["Text"])] = tripod[
+                        "Value"
+                    ]
+
+            for etc in auction["EtcOptions"]:
+                self.etc[etc["Value"]] = etc["Text"]
+                self.etc_codes[etc["Text"]] = etc["Value"]
+
+                for sub in etc["EtcSubs"]:
+                    self.etc_subs[(etc["Value"], sub["Value"])] = sub["Text"]
+                    self.etc_sub_codes[(etc["Value"], sub["Text"])] = sub["Value"]
+
+    @classmethod
+    async def fetch(cls, rest: LostArkRest) -> OptionIndex:
+        """Builds an index from the auction and market options of the API."""
+
+        auction, market = await gather(
+            rest.fetch_auction_options(), rest.fetch_market_options()
+        )
+
+        return cls(auction, market)
+
+    @classmethod
+    def load(cls, path: Union[str, PathLike]) -> OptionIndex:
+        """Builds an index from options persisted with ``dump``."""
+
+        with open(path, "r", encoding="utf-8") as f:
+            data = ujson.load(f)
+
+        return cls(data.get("auction"), data.get("market"))
+
+    def dump(self, path: Union[str, PathLike]) -> None:
+        """Persists the options this index was built from."""
+
+        with open(path, "w", encoding="utf-8") as f:
+            ujson.dump(
+                {"auction": self.auction, "market": self.market},
+                f,
+                ensure_ascii=False,
+            )
+
+    def auction_category_code(self, name: str) -> int:
+        return self.auction_category_codes[name]
+
+    def market_category_code(self, name: str) -> int:
+        return self.market_category_codes[name]
+
+    def skill_code(self, class_name: str, name: str) -> int:
+        return self.skill_codes[(class_name, name)]
+
+    def tripod_code(self, skill: int, name: str) -> int:
+        return self.tripod_codes[(skill, name)]
+
+    def etc_code(self, name: str) -> int:
+        return self.etc_codes[name]
+
+    def etc_sub_code(self, etc: int, name: str) -> int:
+        return self.etc_sub_codes[(etc, name)]
+
+    def engraving_code(self, name: str) -> Tuple[int, int]:
+        """Returns the first and second option of an engraving search."""
+
+        etc = self.etc_codes[ENGRAVING]
+
+        return etc, self.etc_sub_codes[(etc, name)]
+
+    def __validate_common(
+        self,
+        request: Any,
+        options: Optional[Any],
+        categories: Dict[int, str],
+        errors: List[str],
+    ) -> None:
+        code = request.get("CategoryCode")
+        if options is not None and code is not None and code not in categories:
+            errors.append(f"Unknown category code: {code}")
+
+        class_name = request.get("CharacterClass")
+        if class_name and class_name not in self.classes:
+            errors.append(f"Unknown character class: {class_name}")
+
+        grade = request.get("ItemGrade")
+        if grade and grade not in self.grades:
+            errors.append(f"Unknown item grade: {grade}")
+
+        tier = request.get("ItemTier")
+        if tier and tier not in self.tiers:
+            errors.append(f"Unknown item tier: {tier}")
+
+    def validate_auction_request(self, request: RequestAuctionItems) -> None:
+        """Raises ValueError if the request refers to unknown options."""
+
+        errors: List[str] = []
+        self.__validate_common(request, self.auction, self.auction_categories, errors)
+
+        for option in request.get("SkillOptions") or []:
+            first, second = option.get("FirstOption"), option.get("SecondOption")
+
+            if first not in self.skills:
+                errors.append(f"Unknown skill option: {first}")
+            elif second is not None and (first, second) not in self.tripods:
+                errors.append(f"Unknown tripod option: {second} of skill {first}")
+
+        for option in request.get("EtcOptions") or []:
+            first, second = option.get("FirstOption"), option.get("SecondOption")
+
+            if first not in self.etc:
+                errors.append(f"Unknown etc option: {first}")
+            elif second is not None and (first, second) not in self.etc_subs:
+                errors.append(f"Unknown etc sub option: {second} of option {first}")
+
+        if errors:
+            raise ValueError("; ".join(errors))
+
+    def validate_market_request(self, request: RequestMarketItems) -> None:
+        """Raises ValueError if the request refers to unknown options."""
+
+        errors: List[str] = []
+        self.__validate_common(request, self.market, self.market_categories, errors)
+
+        if errors:
+            raise ValueError("; ".join(errors))
@@ -0,0 +1,177 @@
+from __future__ import annotations  # for postponed evaluation of annotations
+
+from asyncio import sleep
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging import getLogger
+from time import monotonic
+from typing import TYPE_CHECKING, Dict, Iterator, Mapping, NamedTuple, Optional
+
+from .errors import QuotaExceeded
+
+if TYPE_CHECKING:
+    from .http import RateLimit
+
+logger = getLogger("loapy.quota")
+
+DEFAULT_TENANT = "default"
+
+current_tenant: ContextVar[str] = ContextVar("loapy_tenant", default=DEFAULT_TENANT)
+
+
+@contextmanager
+def tenant(name: str) -> Iterator[None]:
+    """Tags every request made in the block with a tenant."""
+
+    token = current_tenant.set(name)
+
+    try:
+        yield
+    finally:
+        current_tenant.reset(token)
+
+
+class Share(NamedTuple):
+    # Requests per window the tenant can always use
+    reserved: int
+    # Requests per window the tenant can use while others leave room
+    burst: int
+
+
+class QuotaBudget:
+    """Divides the per-window request quota among tenants.
+
+    A tenant can always make its reserved requests. Beyond that, up to its
+    burst, it only takes capacity that is neither used nor reserved by other
+    tenants. A tenant exceeding its share waits for the next window, or gets
+    QuotaExceeded if ``defer`` is disabled. Tenants without a share use
+    ``default``, which reserves nothing.
+
+    A budget given to LostArkRest is bound to its rate limiter, and then
+    follows the limit and reset of the API window. ``limit`` and ``window``
+    are only used until the API has reported them, or for an unbound budget,
+    so they should match the quota of the token.
+    """
+
+    __slots__ = (
+        "shares",
+        "default",
+        "limit",
+        "window",
+        "defer",
+        "totals",
+        "__ratelimit",
+        "__used",
+        "__started",
+        "__ends",
+    )
+
+    def __init__(
+        self,
+        shares: Mapping[str, Share],
+        *,
+        default: Optional[Share] = None,
+        limit: int = 100,
+        window: float = 60.0,
+        defer: bool = True,
+    ) -> None:
+        self.shares = dict(shares)
+        self.default = default if default is not None else Share(0, limit)
+        self.limit = limit
+        self.window = window
+        self.defer = defer
+
+        for name, share in [*self.shares.items(), ("default", self.default)]:
+            if share.reserved > share.burst:
+                raise ValueError(f"Share of {name!r} reserves more than its burst")
+
+        if sum(share.reserved for share in self.shares.values()) > limit:
+            raise ValueError("Shares reserve more requests than the limit")
+
+        # Requests made by each tenant since the budget was created
+        self.totals: Dict[str, int] = {}
+
+        self.__ratelimit: Optional[RateLimit] = None
+        self.__used: Dict[str, int] = {}
+        self.__started: float = monotonic()
+        self.__ends: Optional[float] = None
+
+    def bind(self, ratelimit: RateLimit) -> None:
+        """Follows the window of a rate limiter instead of a local one."""
+
+        self.__ratelimit = ratelimit
+        self.__ends = None
+
+    @property
+    def effective_limit(self) -> int:
+        if self.__ratelimit is not None and self.__ratelimit.limit_loaded:
+            return self.__ratelimit.limit
+
+        return self.limit
+
+    def __deadline(self) -> Optional[float]:
+        if self.__ratelimit is None:
+            return self.__started + self.window
+
+        return self.__ends
+
+    def __roll(self) -> None:
+        now = monotonic()
+        deadline = self.__deadline()
+
+        if deadline is not None and now >= deadline:
+            self.__started = now
+            self.__ends = None
+            self.__used.clear()
+
+        ratelimit = self.__ratelimit
+        if ratelimit is not None and self.__ends is None:
+            # A deadline already passed belongs to the window that just ended
+            if ratelimit.reset_at is not None and ratelimit.reset_at > now:
+                self.__ends = ratelimit.reset_at + ratelimit.margin
+
+    def usage(self) -> Dict[str, int]:
+        """Returns requests made by each tenant in the current window."""
+
+        self.__roll()
+
+        return dict(self.__used)
+
+    def __allows(self, tenant: str) -> bool:
+        share = self.shares.get(tenant, self.default)
+        used = self.__used.get(tenant, 0)
+
+        if used < share.reserved:
+            return True
+
+        if used >= share.burst:
+            return False
+
+        committed = sum(
+            max(self.__used.get(name, 0), self.shares.get(name, self.default).reserved)
+            for name in {*self.shares, *self.__used}
+        )
+
+        return committed < self.effective_limit
+
+    async def acquire(self, tenant: str) -> None:
+        """Accounts a request of a tenant, waiting if its share is exhausted."""
+
+        while True:
+            self.__roll()
+
+            if self.__allows(tenant):
+                self.__used[tenant] = self.__used.get(tenant, 0) + 1
+                self.totals[tenant] = self.totals.get(tenant, 0) + 1
+
+                return
+
+            if not self.defer:
+                raise QuotaExceeded(f"Tenant {tenant!r} exceeded its share")
+
+            logger.debug(f"Tenant {tenant!r} exceeded its share, deferring")
+
+            deadline = self.__deadline()
+
+            # Until the API reports its reset, check again shortly
+            await sleep(1.0 if deadline is None else max(deadline - monotonic(), 0))
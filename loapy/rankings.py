@@ -0,0 +1,162 @@
+from __future__ import annotations  # for postponed evaluation of annotations
+
+from asyncio import gather
+from logging import getLogger
+from time import monotonic
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from .http import LostArkRest
+    from .types.guilds import GuildRanking, ServerName
+
+logger = getLogger("loapy.rankings")
+
+SERVERS: Tuple[ServerName, ...] = (
+    "루페온",
+    "실리안",
+    "아만",
+    "카마인",
+    "카제로스",
+    "아브렐슈드",
+    "카단",
+    "니나브",
+)
+
+GuildKey = Tuple["ServerName", str]
+SortKey = Literal["Rating", "MemberCount", "UpdatedDate"]
+
+
+class GuildLeaderboard:
+    """Snapshot of guild rankings merged across servers."""
+
+    __slots__ = ("entries", "updated", "__index", "__sorted")
+
+    def __init__(self, rankings: Mapping[ServerName, List[GuildRanking]]) -> None:
+        self.entries: List[Tuple[ServerName, GuildRanking]] = [
+            (server, guild) for server, guilds in rankings.items() for guild in guilds
+        ]
+        self.updated: Dict[ServerName, Optional[str]] = {
+            server: max((guild["UpdatedDate"] for guild in guilds), default=None)
+            for server, guilds in rankings.items()
+        }
+
+        self.__index: Dict[GuildKey, int] = {
+            (server, guild["GuildName"]): i
+            for i, (server, guild) in enumerate(self.entries)
+        }
+        self.__sorted: Dict[Tuple[SortKey, bool], List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[Tuple[ServerName, GuildRanking]]:
+        return iter(self.entries)
+
+    def get(self, server: ServerName, guild_name: str) -> Optional[GuildRanking]:
+        """Returns the ranking of a guild, or None if it is not ranked."""
+
+        i = self.__index.get((server, guild_name))
+
+        return None if i is None else self.entries[i][1]
+
+    def sorted_by(
+        self, key: SortKey, *, reverse: bool = True
+    ) -> List[Tuple[ServerName, GuildRanking]]:
+        """Returns every ranked guild across servers ordered by a field."""
+
+        if (key, reverse) not in self.__sorted:
+            self.__sorted[(key, reverse)] = sorted(
+                range(len(self.entries)),
+                key=lambda i: self.entries[i][1][key],
+                reverse=reverse,
+            )
+
+        return [self.entries[i] for i in self.__sorted[(key, reverse)]]
+
+    def deltas(self, previous: GuildLeaderboard) -> Dict[GuildKey, int]:
+        """Returns rank movements since a previous snapshot.
+
+        Positive values mean the guild moved up. Guilds missing from either
+        snapshot are omitted.
+        """
+
+        result: Dict[GuildKey, int] = {}
+
+        for key, i in self.__index.items():
+            before = previous.get(*key)
+
+            if before is not None:
+                result[key] = before["Rank"] - self.entries[i][1]["Rank"]
+
+        return result
+
+
+class GuildRankingAggregator:
+    """Fetches guild rankings of every server and keeps the merged snapshots.
+
+    A snapshot is reused until ``ttl`` seconds have passed, and is only
+    rebuilt when the ``UpdatedDate`` of a server has changed.
+    """
+
+    __slots__ = ("rest", "servers", "ttl", "snapshot", "previous", "__fetched_at")
+
+    def __init__(
+        self,
+        rest: LostArkRest,
+        *,
+        servers: Sequence[ServerName] = SERVERS,
+        ttl: float = 300.0,
+    ) -> None:
+        self.rest = rest
+        self.servers = servers
+        self.ttl = ttl
+
+        self.snapshot: Optional[GuildLeaderboard] = None
+        self.previous: Optional[GuildLeaderboard] = None
+
+        self.__fetched_at: Optional[float] = None
+
+    async def refresh(self, *, force: bool = False) -> GuildLeaderboard:
+        """Returns the latest snapshot, fetching every server if it is stale."""
+
+        if (
+            not force
+            and self.snapshot is not None
+            and self.__fetched_at is not None
+            and monotonic() - self.__fetched_at < self.ttl
+        ):
+            return self.snapshot
+
+        results = await gather(*(self.rest.fetch_guilds(s) for s in self.servers))
+        self.__fetched_at = monotonic()
+
+        rankings = dict(zip(self.servers, results))
+
+        if self.snapshot is not None and self.snapshot.updated == {
+            server: max((guild["UpdatedDate"] for guild in guilds), default=None)
+            for server, guilds in rankings.items()
+        }:
+            logger.debug("Guild rankings are not updated, keeping the snapshot")
+            return self.snapshot
+
+        self.previous, self.snapshot = self.snapshot, GuildLeaderboard(rankings)
+
+        return self.snapshot
+
+    def deltas(self) -> Dict[GuildKey, int]:
+        """Returns rank movements between the last two distinct snapshots."""
+
+        if self.snapshot is None or self.previous is None:
+            return {}
+
+        return self.snapshot.deltas(self.previous)
@@ -0,0 +1,222 @@
+from __future__ import annotations  # for postponed evaluation of annotations
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone
+from logging import getLogger
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Set
+
+if TYPE_CHECKING:
+    from .http import LostArkRest
+    from .types.gamecontents import ContentsCalendar
+
+logger = getLogger("loapy.schedule")
+
+KST = timezone(timedelta(hours=9), "KST")
+
+# Weekly contents are reset on Wednesday 06:00 KST
+RESET_WEEKDAY = 2
+RESET_HOUR = 6
+
+
+def parse_datetime(value: str) -> datetime:
+    """Parses a DateTimeStr of the API, which is in KST without an offset."""
+
+    return localize(datetime.fromisoformat(value))
+
+
+def localize(value: datetime) -> datetime:
+    """Returns a datetime with KST assumed if it has no timezone."""
+
+    return value if value.tzinfo is not None else value.replace(tzinfo=KST)
+
+
+def next_reset(now: datetime) -> datetime:
+    """Returns the first weekly reset after a moment."""
+
+    now = localize(now).astimezone(KST)
+    reset = now.replace(hour=RESET_HOUR, minute=0, second=0, microsecond=0)
+    reset += timedelta(days=(RESET_WEEKDAY - now.weekday()) % 7)
+
+    return reset if reset > now else reset + timedelta(days=7)
+
+
+class Occurrence(NamedTuple):
+    start: datetime
+    contents: ContentsCalendar
+
+
+class _Timeline:
+    __slots__ = ("starts", "occurrences")
+
+    def __init__(self, occurrences: List[Occurrence]) -> None:
+        self.occurrences = occurrences
+        self.starts = [occurrence.start for occurrence in occurrences]
+
+
+class Schedule:
+    """Timeline of a weekly calendar, with start times parsed once.
+
+    Occurrences are kept sorted by start time, overall and per category, so
+    a time range is located by binary search.
+    """
+
+    __slots__ = ("calendar", "__timeline", "__categories", "__rewards")
+
+    def __init__(self, calendar: List[ContentsCalendar]) -> None:
+        self.calendar = calendar
+
+        occurrences = sorted(
+            (
+                Occurrence(parse_datetime(start), contents)
+                for contents in calendar
+                for start in contents["StartTimes"] or []
+            ),
+            key=lambda occurrence: occurrence.start,
+        )
+
+        categories: Dict[str, List[Occurrence]] = {}
+        for occurrence in occurrences:
+            categories.setdefault(occurrence.contents["CategoryName"], []).append(
+                occurrence
+            )
+
+        # Start times of each reward by contents, None when it drops every time
+        self.__rewards: Dict[int, Dict[str, Optional[Set[datetime]]]] = {}
+        for contents in calendar:
+            rewards = self.__rewards.setdefault(id(contents), {})
+
+            for item in contents["RewardItems"] or []:
+                if item["StartTimes"] is None:
+                    rewards[item["Name"]] = None
+                elif rewards.get(item["Name"], set()) is not None:
+                    rewards.setdefault(item["Name"], set()).update(
+                        parse_datetime(start) for start in item["StartTimes"]
+                    )
+
+        self.__timeline = _Timeline(occurrences)
+        self.__categories = {
+            name: _Timeline(values) for name, values in categories.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.__timeline.occurrences)
+
+    @property
+    def categories(self) -> List[str]:
+        return list(self.__categories)
+
+    @property
+    def last(self) -> Optional[datetime]:
+        """Returns the start time of the last occurrence, if any."""
+
+        return self.__timeline.starts[-1] if self.__timeline.starts else None
+
+    def between(
+        self,
+        since: datetime,
+        until: datetime,
+        *,
+        category: Optional[str] = None,
+        item_level: Optional[int] = None,
+        reward: Optional[str] = None,
+    ) -> List[Occurrence]:
+        """Returns occurrences starting in a time range, in order.
+
+        ``item_level`` keeps contents a character of that level can enter,
+        and ``reward`` keeps occurrences rewarding an item of that name.
+        Datetimes without a timezone are taken as KST.
+        """
+
+        since, until = localize(since), localize(until)
+
+        timeline = (
+            self.__timeline if category is None else self.__categories.get(category)
+        )
+
+        if timeline is None:
+            return []
+
+        lo = bisect_left(timeline.starts, since)
+        hi = bisect_right(timeline.starts, until, lo)
+
+        return [
+            occurrence
+            for occurrence in timeline.occurrences[lo:hi]
+            if (item_level is None or occurrence.contents["MinItemLevel"] <= item_level)
+            and (reward is None or self.__rewards_at(occurrence, reward))
+        ]
+
+    def __rewards_at(self, occurrence: Occurrence, reward: str) -> bool:
+        rewards = self.__rewards[id(occurrence.contents)]
+
+        if reward not in rewards:
+            return False
+
+        starts = rewards[reward]
+
+        return starts is None or occurrence.start in starts
+
+    def upcoming(
+        self,
+        within: timedelta,
+        *,
+        now: Optional[datetime] = None,
+        category: Optional[str] = None,
+        item_level: Optional[int] = None,
+        reward: Optional[str] = None,
+    ) -> List[Occurrence]:
+        """Returns occurrences starting in the next ``within``, in order."""
+
+        now = datetime.now(KST) if now is None else localize(now)
+
+        return self.between(
+            now,
+            now + within,
+            category=category,
+            item_level=item_level,
+            reward=reward,
+        )
+
+
+class ScheduleCache:
+    """Keeps the schedule of the current week, fetching the calendar once a week.
+
+    After a weekly reset the calendar is fetched again. If it has not
+    changed yet, the previous schedule is kept and the calendar is retried
+    after ``retry``.
+    """
+
+    __slots__ = ("rest", "retry", "schedule", "__expires")
+
+    def __init__(
+        self, rest: LostArkRest, *, retry: timedelta = timedelta(minutes=10)
+    ) -> None:
+        self.rest = rest
+        self.retry = retry
+
+        self.schedule: Optional[Schedule] = None
+
+        self.__expires: Optional[datetime] = None
+
+    async def get(self, *, now: Optional[datetime] = None) -> Schedule:
+        """Returns the schedule, refreshing it if the week has changed."""
+
+        now = datetime.now(KST) if now is None else localize(now)
+
+        if (
+            self.schedule is not None
+            and self.__expires is not None
+            and now < self.__expires
+        ):
+            return self.schedule
+
+        calendar = await self.rest.fetch_calendar()
+
+        if self.schedule is not None and self.schedule.calendar == calendar:
+            logger.debug("Calendar is not updated yet, keeping the schedule")
+            self.__expires = now + self.retry
+        else:
+            self.schedule = Schedule(calendar)
+            self.__expires = next_reset(now)
+
+        return self.schedule
@@ -0,0 +1,240 @@
+from __future__ import annotations  # for postponed evaluation of annotations
+
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from hashlib import blake2b
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypedDict,
+)
+
+if TYPE_CHECKING:
+    from .types.armories import Character
+
+STAT_TYPES = ("치명", "특화", "제압", "신속", "인내", "숙련")
+
+ENGRAVING_PATTERN = re.compile(r"^(.*?)\s*Lv\.\s*(\d+)$")
+CARD_SET_PATTERN = re.compile(r"^(.*?)\s*\d+세트(?:\s*\((\d+)각성합계\))?$")
+
+
+class CharacterSummary(TypedDict):
+    CharacterName: Optional[str]
+    Stats: Dict[str, int]
+    TotalStats: int
+    GemCount: int
+    GemLevels: int
+    Engravings: Dict[str, int]
+    CardSets: Dict[str, int]
+
+
+@lru_cache(maxsize=None)
+def _numpy() -> Any:
+    # numpy is optional, summaries are computed in pure Python without it
+    try:
+        import numpy
+    except ImportError:
+        return None
+
+    return numpy
+
+
+def _int(value: Optional[str]) -> int:
+    return int(value.replace(",", "")) if value else 0
+
+
+def _digest(character: Character) -> bytes:
+    # Only the fields summaries read, as tooltips and descriptions are much larger
+    profile = character.get("ArmoryProfile") or {}
+    parts = [profile.get("CharacterName") or ""]
+
+    for stat in profile.get("Stats") or []:
+        parts.append(stat["Type"])
+        parts.append(stat["Value"] or "")
+
+    parts.append("")
+    for gem in (character.get("ArmoryGem") or {}).get("Gems") or []:
+        parts.append(str(gem["Level"]))
+
+    parts.append("")
+    for effect in (character.get("ArmoryEngraving") or {}).get("Effects") or []:
+        parts.append(effect["Name"])
+
+    parts.append("")
+    for effect in (character.get("ArmoryCard") or {}).get("Effects") or []:
+        for item in effect["Items"] or []:
+            parts.append(item["Name"])
+
+    return blake2b("\0".join(parts).encode(), digest_size=16).digest()
+
+
+def _copy(summary: CharacterSummary) -> CharacterSummary:
+    return CharacterSummary(
+        CharacterName=summary["CharacterName"],
+        Stats=dict(summary["Stats"]),
+        TotalStats=summary["TotalStats"],
+        GemCount=summary["GemCount"],
+        GemLevels=summary["GemLevels"],
+        Engravings=dict(summary["Engravings"]),
+        CardSets=dict(summary["CardSets"]),
+    )
+
+
+# Effect names repeat across characters, so each one is parsed only once
+@lru_cache(maxsize=4096)
+def _parse_engraving(name: str) -> Optional[Tuple[str, int]]:
+    match = ENGRAVING_PATTERN.match(name)
+
+    return None if match is None else (match.group(1), int(match.group(2)))
+
+
+@lru_cache(maxsize=4096)
+def _parse_card_set(name: str) -> Optional[Tuple[str, int]]:
+    match = CARD_SET_PATTERN.match(name)
+
+    return None if match is None else (match.group(1), int(match.group(2) or 0))
+
+
+def _engravings(character: Character) -> Dict[str, int]:
+    result: Dict[str, int] = {}
+
+    for effect in (character.get("ArmoryEngraving") or {}).get("Effects") or []:
+        parsed = _parse_engraving(effect["Name"])
+
+        if parsed is not None:
+            result[parsed[0]] = parsed[1]
+
+    return result
+
+
+def _card_sets(character: Character) -> Dict[str, int]:
+    result: Dict[str, int] = {}
+
+    for effect in (character.get("ArmoryCard") or {}).get("Effects") or []:
+        for item in effect["Items"] or []:
+            parsed = _parse_card_set(item["Name"])
+
+            if parsed is not None:
+                result[parsed[0]] = max(result.get(parsed[0], 0), parsed[1])
+
+    return result
+
+
+def _compute(characters: List[Character]) -> List[CharacterSummary]:
+    np = _numpy()
+    size = len(characters)
+    column = {name: i for i, name in enumerate(STAT_TYPES)}
+
+    # Flattened columns, one entry per stat and per gem, tagged with its owner
+    stat_owners: List[int] = []
+    stat_columns: List[int] = []
+    stat_values: List[int] = []
+    gem_owners: List[int] = []
+    gem_levels: List[int] = []
+
+    for i, character in enumerate(characters):
+        for stat in (character.get("ArmoryProfile") or {}).get("Stats") or []:
+            if stat["Type"] in column:
+                stat_owners.append(i)
+                stat_columns.append(column[stat["Type"]])
+                stat_values.append(_int(stat["Value"]))
+
+        for gem in (character.get("ArmoryGem") or {}).get("Gems") or []:
+            gem_owners.append(i)
+            gem_levels.append(gem["Level"])
+
+    # numpy only speeds up the reductions, flattening above is most of the work
+    if np is not None:
+        stats = np.zeros((size, len(STAT_TYPES)), dtype=np.int64)
+        np.add.at(
+            stats,
+            (
+                np.asarray(stat_owners, dtype=np.intp),
+                np.asarray(stat_columns, dtype=np.intp),
+            ),
+            np.asarray(stat_values, dtype=np.int64),
+        )
+
+        owners = np.asarray(gem_owners, dtype=np.intp)
+
+        totals = stats.sum(axis=1).tolist()
+        gem_counts = np.bincount(owners, minlength=size).tolist()
+        gem_sums = (
+            np.bincount(owners, weights=gem_levels, minlength=size)
+            .astype(np.int64)
+            .tolist()
+        )
+        matrix = stats.tolist()
+    else:
+        matrix = [[0] * len(STAT_TYPES) for _ in range(size)]
+        for owner, index, value in zip(stat_owners, stat_columns, stat_values):
+            matrix[owner][index] += value
+
+        totals = [sum(row) for row in matrix]
+        gem_counts = [0] * size
+        gem_sums = [0] * size
+        for owner, level in zip(gem_owners, gem_levels):
+            gem_counts[owner] += 1
+            gem_sums[owner] += level
+
+    return [
+        CharacterSummary(
+            CharacterName=(character.get("ArmoryProfile") or {}).get("CharacterName"),
+            Stats=dict(zip(STAT_TYPES, matrix[i])),
+            TotalStats=totals[i],
+            GemCount=gem_counts[i],
+            GemLevels=gem_sums[i],
+            Engravings=_engravings(character),
+            CardSets=_card_sets(character),
+        )
+        for i, character in enumerate(characters)
+    ]
+
+
+class SummaryCache:
+    """Computes summaries of characters in batches, memoized by content.
+
+    Summaries are keyed by a digest of the parts of a response they are
+    derived from, so unchanged characters are not computed again.
+    """
+
+    __slots__ = ("maxsize", "__cache")
+
+    def __init__(self, maxsize: int = 262144) -> None:
+        self.maxsize = maxsize
+
+        self.__cache: OrderedDict[bytes, CharacterSummary] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__cache)
+
+    def summarize(self, character: Character) -> CharacterSummary:
+        return self.summarize_many([character])[0]
+
+    def summarize_many(self, characters: Iterable[Character]) -> List[CharacterSummary]:
+        characters = list(characters)
+        digests = [_digest(character) for character in characters]
+
+        misses: Dict[bytes, Character] = {}
+        for digest, character in zip(digests, characters):
+            if digest in self.__cache:
+                self.__cache.move_to_end(digest)
+            else:
+                misses[digest] = character
+
+        for digest, summary in zip(misses, _compute(list(misses.values()))):
+            self.__cache[digest] = summary
+
+        # Cached summaries are shared, so callers get their own copies
+        summaries = [_copy(self.__cache[digest]) for digest in digests]
+
+        while len(self.__cache) > self.maxsize:
+            self.__cache.popitem(last=False)
+
+        return summaries
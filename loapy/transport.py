@@ -0,0 +1,296 @@
+from __future__ import annotations  # for postponed evaluation of annotations
+
+import gzip
+from abc import ABC, abstractmethod
+from asyncio import sleep
+from email.utils import formatdate
+from itertools import count
+from logging import getLogger
+from math import ceil
+from time import monotonic, time
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import ujson
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+    from aiohttp import BaseConnector, ClientSession
+
+logger = getLogger("loapy.transport")
+
+CassettePath = Union[str, "PathLike[str]"]
+
+
+class TransportResponse(NamedTuple):
+    status: int
+    headers: Mapping[str, str]
+    body: str
+
+
+class Transport(ABC):
+    """Sends requests of LostArkRest to the API, or to anything pretending to."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        headers: Mapping[str, str],
+        data: Optional[str] = None,
+        params: Optional[Mapping[str, str]] = None,
+    ) -> TransportResponse:
+        ...
+
+    async def close(self) -> None:
+        pass
+
+
+class AiohttpTransport(Transport):
+    """Transport sending requests with an aiohttp ClientSession."""
+
+    __slots__ = ("base", "__connector", "__session")
+
+    def __init__(self, base: str, *, connector: Optional[BaseConnector] = None) -> None:
+        self.base = base
+
+        self.__connector: Optional[BaseConnector] = connector
+        self.__session: Optional[ClientSession] = None
+
+    def __create_session(self) -> ClientSession:
+        # aiohttp is imported on first request to keep `import loapy` fast
+        from aiohttp import ClientSession
+
+        return ClientSession(self.base, connector=self.__connector)
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        headers: Mapping[str, str],
+        data: Optional[str] = None,
+        params: Optional[Mapping[str, str]] = None,
+    ) -> TransportResponse:
+        if self.__session is None:
+            self.__session = self.__create_session()
+
+        from yarl import URL
+
+        # Endpoints of LostArkRest are already quoted, see names.character_key
+        url = (
+            URL(self.base + endpoint, encoded=True) if endpoint.isascii() else endpoint
+        )
+
+        async with self.__session.request(
+            method, url, headers=headers, data=data, params=params
+        ) as response:
+            return TransportResponse(
+                response.status, response.headers, await response.text()
+            )
+
+    async def close(self) -> None:
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+
+
+def _open(path: CassettePath, mode: str) -> IO[str]:
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+
+    return open(path, mode, encoding="utf-8")
+
+
+def _exchanges(path: CassettePath) -> Iterator[Dict[str, Any]]:
+    with _open(path, "r") as f:
+        try:
+            for line in f:
+                if not line.strip():
+                    continue
+
+                try:
+                    yield ujson.loads(line)
+                except ValueError:
+                    # Only the last line can be cut short, by a crashed recording
+                    logger.warning(f"Skipping a truncated exchange in {path}")
+        except EOFError:
+            # A gzip cassette of a crashed recording has no end-of-stream marker
+            logger.warning(f"Cassette {path} ends abruptly")
+
+
+def _key(
+    method: str,
+    endpoint: str,
+    data: Optional[str],
+    params: Optional[Mapping[str, str]],
+) -> Tuple[str, str, Optional[str], Tuple[Tuple[str, str], ...]]:
+    return method, endpoint, data, tuple(sorted((params or {}).items()))
+
+
+class RecordingTransport(Transport):
+    """Transport writing every exchange of another transport to a cassette.
+
+    A cassette is a JSON Lines file, gzip compressed if the path ends with
+    ``.gz``, with one exchange per line.
+    """
+
+    __slots__ = ("inner", "__file")
+
+    def __init__(self, inner: Transport, path: CassettePath) -> None:
+        self.inner = inner
+
+        self.__file = _open(path, "a")
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        headers: Mapping[str, str],
+        data: Optional[str] = None,
+        params: Optional[Mapping[str, str]] = None,
+    ) -> TransportResponse:
+        response = await self.inner.request(
+            method, endpoint, headers=headers, data=data, params=params
+        )
+
+        self.__file.write(
+            ujson.dumps(
+                {
+                    "method": method,
+                    "endpoint": endpoint,
+                    "data": data,
+                    "params": dict(params or {}),
+                    "status": response.status,
+                    "headers": dict(response.headers),
+                    "body": response.body,
+                },
+                ensure_ascii=False,
+            )
+            + "\n"
+        )
+        # A crashed or killed load test keeps every exchange recorded so far
+        self.__file.flush()
+
+        return response
+
+    async def close(self) -> None:
+        self.__file.close()
+        await self.inner.close()
+
+
+class ReplayTransport(Transport):
+    """Transport serving responses from a cassette without touching the network.
+
+    Responses recorded for the same request are served in turn. Rate limit
+    headers are generated for a fixed window of ``limit`` requests, answering
+    429 once it is exhausted, so the rate limiter of LostArkRest behaves as it
+    does against the API. Without ``limit`` the window is practically endless.
+    """
+
+    __slots__ = ("latency", "limit", "window", "__responses", "__window", "__used")
+
+    SIMULATED: ClassVar[Tuple[str, ...]] = (
+        "date",
+        "retry-after",
+        "x-ratelimit-limit",
+        "x-ratelimit-remaining",
+        "x-ratelimit-reset",
+    )
+
+    def __init__(
+        self,
+        path: CassettePath,
+        *,
+        latency: float = 0.0,
+        limit: Optional[int] = None,
+        window: float = 60.0,
+    ) -> None:
+        self.latency = latency
+        self.limit = limit if limit is not None else 2**31 - 1
+        self.window = window
+
+        responses: Dict[tuple, List[TransportResponse]] = {}
+
+        for exchange in _exchanges(path):
+            key = _key(
+                exchange["method"],
+                exchange["endpoint"],
+                exchange["data"],
+                exchange["params"],
+            )
+            headers = {
+                name: value
+                for name, value in exchange["headers"].items()
+                if name.lower() not in self.SIMULATED
+            }
+
+            responses.setdefault(key, []).append(
+                TransportResponse(exchange["status"], headers, exchange["body"])
+            )
+
+        self.__responses = {key: (values, count()) for key, values in responses.items()}
+        self.__window: float = monotonic()
+        self.__used: int = 0
+
+        logger.debug(f"Loaded {len(self.__responses)} distinct requests from {path}")
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        headers: Mapping[str, str],
+        data: Optional[str] = None,
+        params: Optional[Mapping[str, str]] = None,
+    ) -> TransportResponse:
+        key = _key(method, endpoint, data, params)
+
+        if key not in self.__responses:
+            raise LookupError(f"No recorded response for {method} {endpoint}")
+
+        if self.latency > 0:
+            await sleep(self.latency)
+
+        now = monotonic()
+        if now - self.__window >= self.window:
+            self.__window = now
+            self.__used = 0
+
+        left = self.__window + self.window - now
+        simulated = {
+            "Date": formatdate(time(), usegmt=True),
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Reset": str(ceil(time() + left)),
+        }
+
+        if self.__used >= self.limit:
+            simulated["X-RateLimit-Remaining"] = "0"
+            simulated["Retry-After"] = str(ceil(left))
+
+            return TransportResponse(429, simulated, "")
+
+        self.__used += 1
+        simulated["X-RateLimit-Remaining"] = str(self.limit - self.__used)
+
+        values, counter = self.__responses[key]
+        response = values[next(counter) % len(values)]
+
+        return response._replace(headers={**response.headers, **simulated})
@@ -1,7 +1,9 @@
-from typing import TypedDict
+from typing import Literal, TypedDict
 
 from .basic import DateTimeStr
 
+ServerName = Literal["루페온", "실리안", "아만", "카마인", "카제로스", "아브렐슈드", "카단", "니나브"]
+
 
 class GuildRanking(TypedDict):
     Rank: int